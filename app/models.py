@@ -1,92 +1,344 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import (
+    CHAR,
+    BigInteger,
+    DDL,
+    CheckConstraint,
+    Column,
+    DateTime,
+    FromClause,
+    Identity,
+    Index,
+    Integer,
+    ScalarResult,
+    SmallInteger,
+    Text,
+    TypeDecorator,
+    UniqueConstraint,
+    bindparam,
+    event,
+    func,
+    lambda_stmt,
+    text,
+    update,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapper, SessionTransaction, raiseload, selectinload
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.orm.interfaces import LoaderOption
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql import column, table
+from pydantic import ConfigDict
+from sqlmodel import SQLModel, Field, Relationship, Session, col, desc, select
 from datetime import datetime, time
-from typing import Optional, List, Dict, Any
+from itertools import chain
+from typing import Optional, List, Dict, Any, NamedTuple, Sequence, Tuple, Union
 from enum import Enum
+import json
 
 
-# Enums for categories
-class StudentCategory(str, Enum):
-    SUB_JUNIOR = "Sub Junior"
-    JUNIOR = "Junior"
-    SENIOR = "Senior"
-    SUPER_SENIOR = "Super Senior"
+# Enums for categories; stored as SMALLINT, display names live in CATEGORY_LABELS
+class StudentCategory(int, Enum):
+    SUB_JUNIOR = 0
+    JUNIOR = 1
+    SENIOR = 2
+    SUPER_SENIOR = 3
+
+
+CATEGORY_LABELS: Dict[StudentCategory, str] = {
+    StudentCategory.SUB_JUNIOR: "Sub Junior",
+    StudentCategory.JUNIOR: "Junior",
+    StudentCategory.SENIOR: "Senior",
+    StudentCategory.SUPER_SENIOR: "Super Senior",
+}
+
+# Rank used by the scheduler when ordering participants or slots by category
+CATEGORY_ORDER: Dict[StudentCategory, int] = {category: rank for rank, category in enumerate(StudentCategory)}
+
+
+def category_key(item: "Union[Student, StudentWithEvents, Participant]") -> int:
+    """Sort key ranking items by category, e.g. ``students.sort(key=category_key)``"""
+    return CATEGORY_ORDER[item.category]
+
+
+# Allowed SMALLINT values, enforced by CHECK constraints the way a native ENUM type would be
+CATEGORY_VALUES_SQL = ", ".join(str(category.value) for category in StudentCategory)
+
+
+class _CategoryType(TypeDecorator[StudentCategory]):
+    """SMALLINT column that loads its values back as StudentCategory members"""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[int], dialect) -> Optional[int]:
+        return None if value is None else int(value)
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[StudentCategory]:
+        return None if value is None else StudentCategory(value)
+
+
+class Participant(NamedTuple):
+    """Participant row shown on printed event and schedule lists"""
+
+    name: str
+    class_name: str
+    category: StudentCategory
+
+
+class SchedulerEvent(NamedTuple):
+    """Scheduler input for one active event, read as plain column values"""
+
+    id: int
+    priority: int
+    average_time_minutes: int
+    max_participants: Optional[int]
+    participant_count: int
+
+
+def minute_of_day(value: time) -> int:
+    """Minutes since midnight, as stored in ScheduleSlot.start_min/end_min"""
+    return value.hour * 60 + value.minute
+
+
+def _id_column() -> Column:
+    """BIGINT identity primary key; PostgreSQL hands out ids 100 at a time per connection to cut sequence reads"""
+    # SQLite only auto-assigns ids for INTEGER PRIMARY KEY columns
+    return Column(BigInteger().with_variant(Integer, "sqlite"), Identity(always=False, cache=100), primary_key=True)
+
+
+def _active_index(name: str, *columns: str) -> Index:
+    """Partial index over active rows only; both PostgreSQL and SQLite keep the WHERE clause"""
+    return Index(name, *columns, postgresql_where=text("is_active"), sqlite_where=text("is_active"))
 
 
 # Persistent models (stored in database)
+# Timestamps are stamped by the database (server_default=now()), so they are None until the row is flushed
 class Admin(SQLModel, table=True):
     __tablename__ = "admins"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
     username: str = Field(unique=True, max_length=50)
-    password_hash: str = Field(max_length=255)  # Store hashed password
+    password_hash: str = Field(sa_column=Column(CHAR(60), nullable=False))  # Fixed-width bcrypt digest
     name: str = Field(max_length=100)
     email: str = Field(unique=True, max_length=255)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
 
 class Student(SQLModel, table=True):
     __tablename__ = "students"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
     name: str = Field(max_length=100)
-    class_name: str = Field(max_length=50)  # Using class_name instead of class (reserved keyword)
-    category: StudentCategory = Field(default=StudentCategory.SUB_JUNIOR)
+    class_name: str = Field(max_length=50, index=True)  # Using class_name instead of class (reserved keyword)
+    category: StudentCategory = Field(
+        default=StudentCategory.SUB_JUNIOR,
+        sa_column=Column(
+            _CategoryType,
+            CheckConstraint(f"category IN ({CATEGORY_VALUES_SQL})", name="ck_students_category"),
+            nullable=False,
+            default=StudentCategory.SUB_JUNIOR.value,
+            index=True,
+        ),
+    )
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
     # Relationships
     event_participations: List["EventParticipant"] = Relationship(back_populates="student")
 
+    # Partial index: most queries only touch active students, so only those rows are indexed
+    __table_args__ = (_active_index("ix_student_active", "id"),)
+
 
 class Event(SQLModel, table=True):
+    """Event definition
+
+    Listing routes that do not render participants or slots should query with
+    ``options(*strict_load())`` so accidental relationship access raises instead of lazy-loading.
+    """
+
     __tablename__ = "events"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
     name: str = Field(max_length=200)
-    category: str = Field(max_length=100)  # e.g., "Elocution in English", "Song Arabic", "Mappila Song"
+    category: str = Field(max_length=100, index=True)  # e.g., "Elocution in English", "Song Arabic", "Mappila Song"
     max_participants: Optional[int] = Field(default=None, ge=1)  # Optional maximum number of participants
     priority: int = Field(default=1, ge=1, le=10)  # Priority for scheduling (1-10, higher = more priority)
     average_time_minutes: int = Field(default=30, ge=1)  # Average time per event in minutes for scheduling
-    description: str = Field(default="", max_length=1000)
+    description: str = Field(default="", sa_column=Column(Text, nullable=False))  # length is checked by the schemas
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
     # Relationships
     event_participations: List["EventParticipant"] = Relationship(back_populates="event")
     schedule_slots: List["ScheduleSlot"] = Relationship(back_populates="event")
 
+    # Partial indexes over active events only; the priority one serves scheduler ordering
+    __table_args__ = (
+        _active_index("ix_event_active", "id"),
+        _active_index("ix_event_active_priority", "priority"),
+    )
+
+    @classmethod
+    def scheduler_rows(cls, session: Session) -> List[SchedulerEvent]:
+        """Active events with participant counts, highest priority first, without hydrating Event objects"""
+        counts = participant_counts_source(session)
+        query = (
+            select(  # type: ignore[call-overload]
+                cls.id,
+                cls.priority,
+                cls.average_time_minutes,
+                cls.max_participants,
+                func.coalesce(counts.c.participant_count, 0),
+            )
+            .outerjoin(counts, counts.c.event_id == cls.id)
+            .where(col(cls.is_active))
+            .order_by(desc(cls.priority), col(cls.id))
+        )
+        return [SchedulerEvent(*row) for row in session.exec(query).all()]
+
 
 class EventParticipant(SQLModel, table=True):
     __tablename__ = "event_participants"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    student_id: int = Field(foreign_key="students.id")
-    event_id: int = Field(foreign_key="events.id")
-    assigned_by_admin_id: int = Field(foreign_key="admins.id")
-    assigned_at: datetime = Field(default_factory=datetime.utcnow)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
+    student_id: int = Field(foreign_key="students.id", sa_type=BigInteger)
+    event_id: int = Field(foreign_key="events.id", sa_type=BigInteger)
+    assigned_by_admin_id: int = Field(foreign_key="admins.id", sa_type=BigInteger)
+    assigned_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    # Also stamped by Core updates such as the student field propagation below, through the column's onupdate
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
+    )
+    # Copies of the student's fields so print queries read participants without joining students;
+    # filled in on insert and kept in sync with Student updates by the listeners below the models
+    student_name: str = Field(default="", max_length=100)
+    student_class_name: str = Field(default="", max_length=50, index=True)
+    student_category: StudentCategory = Field(
+        default=StudentCategory.SUB_JUNIOR,
+        sa_column=Column(
+            _CategoryType,
+            CheckConstraint(
+                f"student_category IN ({CATEGORY_VALUES_SQL})", name="ck_event_participants_student_category"
+            ),
+            nullable=False,
+            default=StudentCategory.SUB_JUNIOR.value,
+            index=True,
+        ),
+    )
 
     # Relationships
     student: Student = Relationship(back_populates="event_participations")
     event: Event = Relationship(back_populates="event_participations")
     assigned_by_admin: Admin = Relationship()
 
-    # Unique constraint to prevent duplicate assignments
-    __table_args__ = ({"extend_existing": True},)
+    # Unique constraint to prevent duplicate assignments; its (student_id, event_id) prefix also
+    # serves per-student lookups, so only the reverse ordering needs its own index
+    __table_args__ = (
+        UniqueConstraint("student_id", "event_id", name="uq_participant"),
+        Index("ix_participant_event_student", "event_id", "student_id"),
+        {"extend_existing": True},
+    )
+
+    @classmethod
+    def bulk_assign(cls, session: Session, pairs: Sequence[Tuple[int, int]], admin_id: int) -> int:
+        """Assign (student_id, event_id) pairs with a single INSERT, skipping existing assignments
+
+        Returns the number of newly created assignments. The caller commits the session.
+        """
+        if not pairs:
+            return 0
+
+        students = {
+            id_: (name, class_name, category)
+            for id_, name, class_name, category in session.exec(
+                select(Student.id, Student.name, Student.class_name, col(Student.category)).where(
+                    col(Student.id).in_({student_id for student_id, _ in pairs})
+                )
+            ).all()
+        }
+        values = []
+        for student_id, event_id in pairs:
+            student = students.get(student_id)
+            if student is None:
+                raise ValueError(f"Student {student_id} not found")
+            name, class_name, category = student
+            values.append(
+                {
+                    "student_id": student_id,
+                    "event_id": event_id,
+                    "assigned_by_admin_id": admin_id,
+                    "student_name": name,
+                    "student_class_name": class_name,
+                    "student_category": category,
+                }
+            )
+
+        match session.get_bind().dialect.name:
+            case "postgresql":
+                insert = postgresql.insert
+            case "sqlite":
+                insert = sqlite.insert
+            case dialect_name:
+                raise NotImplementedError(f"bulk_assign does not support the {dialect_name} dialect")
+        statement = insert(cls).values(values).on_conflict_do_nothing(index_elements=["student_id", "event_id"])
+        result = session.exec(statement)  # type: ignore[call-overload]
+
+        # Core inserts bypass the flush hooks, so flag the participant change for the after_commit listeners
+        session.info[PARTICIPANT_COUNTS_STALE] = True
+        return result.rowcount
+
+    @classmethod
+    def participants_by_event(cls, session: Session, event_ids: List[int]) -> Dict[int, List[Participant]]:
+        """Participants of the given events, read from event_participants alone"""
+        query = (
+            select(cls.event_id, cls.student_name, cls.student_class_name, col(cls.student_category))
+            .where(col(cls.event_id).in_(event_ids))
+            .order_by(col(cls.event_id), col(cls.student_name))
+        )
+        participants: Dict[int, List[Participant]] = {event_id: [] for event_id in event_ids}
+        for event_id, name, class_name, category in session.exec(query).all():
+            participants[event_id].append(Participant(name, class_name, category))
+        return participants
 
 
 class Schedule(SQLModel, table=True):
+    """Schedule header
+
+    Relationships load on access. Printing goes through ``print_cache.get_slot_details``, which reads slots,
+    events and participants with a fixed number of queries; routes that only need some relationships should opt
+    in explicitly, e.g. ``options(*strict_load(Schedule.schedule_slots))``.
+    """
+
     __tablename__ = "schedules"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
     name: str = Field(max_length=200)  # e.g., "Main Event Schedule", "Day 1 Schedule"
-    description: str = Field(default="", max_length=1000)
+    description: str = Field(default="", sa_column=Column(Text, nullable=False))  # length is checked by the schemas
     event_date: datetime = Field()  # Date of the scheduled events
     is_generated: bool = Field(default=False)  # True if auto-generated, False if manually created
     is_finalized: bool = Field(default=False)  # True when schedule is locked for printing
-    created_by_admin_id: int = Field(foreign_key="admins.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_by_admin_id: int = Field(foreign_key="admins.id", sa_type=BigInteger)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    # Bumped whenever the schedule row changes (also by a database trigger), and by print_cache when slots or
+    # participants are removed from it; print_cache.get_last_modified combines it with its slots and participants
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
+    )
 
     # Relationships
     created_by_admin: Admin = Relationship()
@@ -96,23 +348,235 @@ class Schedule(SQLModel, table=True):
 class ScheduleSlot(SQLModel, table=True):
     __tablename__ = "schedule_slots"  # type: ignore[assignment]
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    schedule_id: int = Field(foreign_key="schedules.id")
-    event_id: int = Field(foreign_key="events.id")
+    id: Optional[int] = Field(default=None, sa_column=_id_column())
+    schedule_id: int = Field(foreign_key="schedules.id", sa_type=BigInteger)
+    event_id: int = Field(foreign_key="events.id", sa_type=BigInteger)
     start_time: time = Field()  # Time of day when event starts
     end_time: time = Field()  # Time of day when event ends
+    # Minutes since midnight, derived from start_time/end_time on flush so interval checks compare plain integers.
+    # Only ORM flushes derive them: Core inserts/updates that write the times must also set these with
+    # minute_of_day(); there is no default, so an insert that forgets them fails on NOT NULL.
+    start_min: Optional[int] = Field(default=None, sa_column=Column(SmallInteger, nullable=False))
+    end_min: Optional[int] = Field(default=None, sa_column=Column(SmallInteger, nullable=False))
     venue: str = Field(default="", max_length=200)  # Optional venue information
-    notes: str = Field(default="", max_length=500)  # Additional notes for the slot
+    notes: str = Field(default="", sa_column=Column(Text, nullable=False))  # Additional notes for the slot
     order_index: int = Field(default=0, ge=0)  # Order within the schedule for display
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None, sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False),
+    )
 
     # Relationships
     schedule: Schedule = Relationship(back_populates="schedule_slots")
     event: Event = Relationship(back_populates="schedule_slots")
 
+    __table_args__ = (
+        Index("ix_slot_schedule_order", "schedule_id", "order_index"),
+        Index("ix_slot_schedule_start", "schedule_id", "start_min"),
+        Index("ix_slot_event", "event_id"),
+    )
+
+    @classmethod
+    def interval_rows(cls, session: Session, schedule_id: int) -> Sequence[Tuple[int, int, int]]:
+        """(event_id, start_min, end_min) rows of a schedule, without hydrating ScheduleSlot objects"""
+        query = (
+            select(cls.event_id, cls.start_min, cls.end_min)
+            .where(cls.schedule_id == schedule_id)
+            .order_by(col(cls.start_min))
+        )
+        # The minute columns are NOT NULL; they are only Optional on objects that have not been flushed yet
+        return session.exec(query).all()  # type: ignore[return-value]
+
+
+def _related_student(session: Session, participant: EventParticipant) -> Optional[Student]:
+    """The participant's student if it is already in memory, without emitting SQL"""
+    student = participant.__dict__.get("student")
+    # An assigned relationship wins over student_id, which the flush only syncs from it afterwards
+    if student is not None and (
+        get_history(participant, "student").has_changes() or participant.student_id == student.id
+    ):
+        return student
+    if participant.student_id is None:
+        return None
+    return session.identity_map.get(identity_key(Student, participant.student_id))  # type: ignore[return-value]
+
+
+@event.listens_for(Session, "before_flush")
+def _denormalize_participants(session: Session, flush_context, instances) -> None:
+    """Copy student fields onto new and reassigned participants, reading the missing students in one query"""
+    participants = [obj for obj in session.new if isinstance(obj, EventParticipant)] + [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, EventParticipant)
+        and any(get_history(obj, key).has_changes() for key in ("student_id", "student"))
+    ]
+    if not participants:
+        return
+
+    related = [(participant, _related_student(session, participant)) for participant in participants]
+    missing = {participant.student_id for participant, student in related if student is None}
+    fetched: Dict[Optional[int], Tuple[str, str, StudentCategory]] = {}
+    if missing:
+        query = select(Student.id, Student.name, Student.class_name, col(Student.category)).where(
+            col(Student.id).in_(missing)
+        )
+        fetched = {
+            student_id: (name, class_name, category) for student_id, name, class_name, category in session.exec(query)
+        }
+
+    for participant, student in related:
+        if student is not None:
+            fields = (student.name, student.class_name, student.category)
+        elif participant.student_id in fetched:
+            fields = fetched[participant.student_id]
+        else:
+            continue  # the foreign key constraint reports the missing student
+        participant.student_name, participant.student_class_name, participant.student_category = fields
+
+
+@event.listens_for(Student, "after_update")
+def _propagate_student_fields(mapper: Mapper, connection: Connection, target: Student) -> None:
+    if not any(get_history(target, key).has_changes() for key in ("name", "class_name", "category")):
+        return
+    connection.execute(
+        update(EventParticipant)
+        .where(col(EventParticipant.student_id) == target.id)
+        .values(student_name=target.name, student_class_name=target.class_name, student_category=target.category)
+    )
+
+
+@event.listens_for(ScheduleSlot, "before_insert")
+@event.listens_for(ScheduleSlot, "before_update")
+def _sync_slot_minutes(mapper: Mapper, connection: Connection, target: ScheduleSlot) -> None:
+    target.start_min = minute_of_day(target.start_time)
+    target.end_min = minute_of_day(target.end_time)
+
+
+def strict_load(*paths: Any) -> Sequence[LoaderOption]:
+    """Loader options that selectin-load the given relationships and raise on any other access"""
+    return [selectinload(path) for path in paths] + [raiseload("*")]
+
+
+def iter_schedule_slots(session: Session, schedule_id: int) -> ScalarResult[ScheduleSlot]:
+    """Stream a schedule's slots in display order through a server-side cursor, 200 rows at a time
+
+    Only ScheduleSlot.event is loaded alongside each batch, so memory stays bounded for large exports.
+    The session must stay open while the result is consumed.
+    """
+    query = (
+        select(ScheduleSlot)
+        .where(ScheduleSlot.schedule_id == schedule_id)
+        .order_by(col(ScheduleSlot.order_index))
+        .options(*strict_load(ScheduleSlot.event))
+        .execution_options(yield_per=200)
+    )
+    return session.exec(query)
+
+
+# Materialized participant counts (PostgreSQL only). The view is not part of the metadata tables, so it is
+# created/dropped alongside them; app.participant_counts refreshes it after commits that touched event_participants.
+PARTICIPANT_COUNTS_VIEW = "mv_event_participant_counts"
+# Session.info flag for a transaction that changed event_participants; other after_commit hooks may read it,
+# it is cleared once the outermost transaction ends
+PARTICIPANT_COUNTS_STALE = "participant_counts_stale"
+
+participant_counts_view = table(
+    PARTICIPANT_COUNTS_VIEW,
+    column("event_id", Integer),
+    column("participant_count", Integer),
+    column("last_assigned_at", DateTime(timezone=True)),
+)
+
+event.listen(
+    SQLModel.metadata,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {PARTICIPANT_COUNTS_VIEW} AS "
+        "SELECT event_id, COUNT(*) AS participant_count, MAX(assigned_at) AS last_assigned_at "
+        "FROM event_participants GROUP BY event_id"
+    ).execute_if(dialect="postgresql"),
+)
+# The unique index is what allows REFRESH ... CONCURRENTLY, so readers are never blocked by a refresh
+event.listen(
+    SQLModel.metadata,
+    "after_create",
+    DDL(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{PARTICIPANT_COUNTS_VIEW}_event ON {PARTICIPANT_COUNTS_VIEW} (event_id)"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    SQLModel.metadata,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {PARTICIPANT_COUNTS_VIEW}").execute_if(dialect="postgresql"),
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_participant_changes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, EventParticipant) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[PARTICIPANT_COUNTS_STALE] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_participant_changes(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(PARTICIPANT_COUNTS_STALE, None)
+
+
+def participant_counts_source(session: Session) -> FromClause:
+    """Selectable with (event_id, participant_count, last_assigned_at) rows for the session's database
+
+    Uses the materialized view on PostgreSQL and an equivalent GROUP BY subquery elsewhere.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return participant_counts_view
+    return (
+        select(
+            EventParticipant.event_id,
+            func.count().label("participant_count"),
+            func.max(EventParticipant.assigned_at).label("last_assigned_at"),
+        )
+        .group_by(EventParticipant.event_id)  # type: ignore[arg-type]
+        .subquery("participant_counts")
+    )
+
+
+# Schedule updated_at trigger (PostgreSQL only), so writes that bypass the ORM's onupdate also bump it.
+# Child tables deliberately have no triggers touching their schedule: that would make unrelated participant and
+# slot writes queue behind each other on the schedules row. print_cache.get_last_modified combines them at read
+# time instead, and only bumps the schedule itself for removals, which leave no row to read a timestamp from.
+SCHEDULE_TOUCH_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION schedules_set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at := now();
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS trg_schedules_updated_at ON schedules",
+    (
+        "CREATE TRIGGER trg_schedules_updated_at BEFORE UPDATE ON schedules "
+        "FOR EACH ROW EXECUTE FUNCTION schedules_set_updated_at()"
+    ),
+)
+
+for statement in SCHEDULE_TOUCH_DDL:
+    event.listen(SQLModel.metadata, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
+# Schemas are immutable and reject unknown keys; read-only ones can also be built from ORM objects via model_validate
+SCHEMA_CONFIG = ConfigDict(extra="forbid", frozen=True, validate_assignment=False, arbitrary_types_allowed=False)
+READ_ONLY_SCHEMA_CONFIG = ConfigDict(SCHEMA_CONFIG, from_attributes=True)
+
+
 class AdminCreate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     username: str = Field(max_length=50)
     password: str = Field(min_length=6, max_length=100)  # Raw password for input
     name: str = Field(max_length=100)
@@ -120,23 +584,31 @@ class AdminCreate(SQLModel, table=False):
 
 
 class AdminUpdate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=100)
     email: Optional[str] = Field(default=None, max_length=255)
     is_active: Optional[bool] = Field(default=None)
 
 
 class AdminLogin(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     username: str = Field(max_length=50)
     password: str = Field(max_length=100)
 
 
 class StudentCreate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     name: str = Field(max_length=100)
     class_name: str = Field(max_length=50)
     category: StudentCategory = Field(default=StudentCategory.SUB_JUNIOR)
 
 
 class StudentUpdate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=100)
     class_name: Optional[str] = Field(default=None, max_length=50)
     category: Optional[StudentCategory] = Field(default=None)
@@ -144,6 +616,8 @@ class StudentUpdate(SQLModel, table=False):
 
 
 class EventCreate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     name: str = Field(max_length=200)
     category: str = Field(max_length=100)
     max_participants: Optional[int] = Field(default=None, ge=1)
@@ -153,6 +627,8 @@ class EventCreate(SQLModel, table=False):
 
 
 class EventUpdate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     name: Optional[str] = Field(default=None, max_length=200)
     category: Optional[str] = Field(default=None, max_length=100)
     max_participants: Optional[int] = Field(default=None, ge=1)
@@ -163,12 +639,16 @@ class EventUpdate(SQLModel, table=False):
 
 
 class EventParticipantCreate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     student_id: int
     event_id: int
     assigned_by_admin_id: int
 
 
 class ScheduleCreate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     name: str = Field(max_length=200)
     description: str = Field(default="", max_length=1000)
     event_date: datetime
@@ -176,6 +656,8 @@ class ScheduleCreate(SQLModel, table=False):
 
 
 class ScheduleSlotCreate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     schedule_id: int
     event_id: int
     start_time: time
@@ -186,6 +668,8 @@ class ScheduleSlotCreate(SQLModel, table=False):
 
 
 class ScheduleSlotUpdate(SQLModel, table=False):
+    model_config = SCHEMA_CONFIG  # type: ignore[assignment]
+
     start_time: Optional[time] = Field(default=None)
     end_time: Optional[time] = Field(default=None)
     venue: Optional[str] = Field(default=None, max_length=200)
@@ -194,31 +678,73 @@ class ScheduleSlotUpdate(SQLModel, table=False):
 
 
 # Read-only schemas for display and printing
+
+
 class StudentWithEvents(SQLModel, table=False):
     """Student data with their participating events for participant list printing"""
 
+    model_config = READ_ONLY_SCHEMA_CONFIG  # type: ignore[assignment]
+
     id: int
     name: str
     class_name: str
     category: StudentCategory
     events: List[str]  # List of event names
 
+    @classmethod
+    def load_all(cls, session: Session) -> List["StudentWithEvents"]:
+        """All students with their event names, aggregated in a single query"""
+        # SQLite has no array type, so names come back as a JSON array there; unlike a separator-joined string
+        # this round-trips any event name
+        if session.get_bind().dialect.name == "postgresql":
+            event_names = func.array_agg(Event.name).filter(col(Event.id).is_not(None))
+        else:
+            event_names = func.json_group_array(Event.name).filter(col(Event.id).is_not(None))
+
+        query = (
+            select(  # type: ignore[call-overload]
+                Student.id, Student.name, Student.class_name, Student.category, event_names.label("events")
+            )
+            .outerjoin(EventParticipant, col(EventParticipant.student_id) == col(Student.id))
+            .outerjoin(Event, col(Event.id) == col(EventParticipant.event_id))
+            .group_by(col(Student.id))
+            .order_by(col(Student.name))
+        )
+
+        students = []
+        for student_id, name, class_name, category, names in session.exec(query).all():
+            match names:
+                case None:
+                    events = []
+                case str():
+                    events = json.loads(names)
+                case _:
+                    events = list(names)
+            students.append(
+                cls(id=student_id, name=name, class_name=class_name, category=category, events=sorted(events))
+            )
+        return students
+
 
 class EventWithParticipants(SQLModel, table=False):
     """Event data with participants for event schedule printing"""
 
+    model_config = READ_ONLY_SCHEMA_CONFIG  # type: ignore[assignment]
+
     id: int
     name: str
     category: str
     start_time: Optional[time]
     end_time: Optional[time]
     venue: str
-    participants: List[Dict[str, Any]]  # List of participant details with name, class, category
+    participants: List[Participant]
 
 
 class ScheduleSlotDetail(SQLModel, table=False):
     """Detailed schedule slot for printing with event and participant information"""
 
+    model_config = READ_ONLY_SCHEMA_CONFIG  # type: ignore[assignment]
+
     id: int
     event_name: str
     event_category: str
@@ -227,4 +753,42 @@ class ScheduleSlotDetail(SQLModel, table=False):
     venue: str
     notes: str
     participant_count: int
-    participants: List[Dict[str, Any]]  # Participants with name, class, category
+    participants: Tuple[Participant, ...]  # immutable, since cached details are shared between callers
+
+
+class EventParticipantCount(SQLModel, table=False):
+    """Participant count per event, as stored in the mv_event_participant_counts view"""
+
+    model_config = READ_ONLY_SCHEMA_CONFIG  # type: ignore[assignment]
+
+    event_id: int
+    participant_count: int
+    last_assigned_at: datetime
+
+    @classmethod
+    def by_event(cls, session: Session) -> Dict[int, "EventParticipantCount"]:
+        """Counts for all events with at least one participant, keyed by event id"""
+        source = participant_counts_source(session)
+        rows = session.exec(
+            select(source.c.event_id, source.c.participant_count, source.c.last_assigned_at)  # type: ignore[call-overload]
+        ).all()
+        return {
+            event_id: cls(event_id=event_id, participant_count=participant_count, last_assigned_at=last_assigned_at)
+            for event_id, participant_count, last_assigned_at in rows
+        }
+
+
+# Pre-built statements for the most frequently hit queries. lambda_stmt caches the constructed and compiled
+# SELECT, so repeated calls skip building the statement tree. They load only the selected rows, any relationship
+# access raises, and session.scalars() returns the model instances:
+#   session.scalars(STUDENT_ACTIVE_STMT).all()
+#   session.scalars(SCHEDULE_BY_ID_STMT, {"sid": schedule_id}).first()
+STUDENT_ACTIVE_STMT = lambda_stmt(
+    lambda: select(Student).where(col(Student.is_active)).order_by(col(Student.name)).options(*strict_load())
+)
+EVENT_ACTIVE_STMT = lambda_stmt(
+    lambda: select(Event).where(col(Event.is_active)).order_by(col(Event.name)).options(*strict_load())
+)
+SCHEDULE_BY_ID_STMT = lambda_stmt(
+    lambda: select(Schedule).where(Schedule.id == bindparam("sid")).options(*strict_load())
+)
@@ -0,0 +1,80 @@
+"""Background refresh of the materialized participant counts view (PostgreSQL only)"""
+
+from logging import getLogger
+from threading import Condition, Thread
+from time import sleep
+from typing import Optional
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from app.models import PARTICIPANT_COUNTS_STALE, PARTICIPANT_COUNTS_VIEW
+
+logger = getLogger(__name__)
+
+# Failed refreshes are retried after RETRY_INITIAL_SECONDS, doubling up to RETRY_MAX_SECONDS
+RETRY_INITIAL_SECONDS = 1.0
+RETRY_MAX_SECONDS = 300.0
+
+# Commits only bump _requested; a single worker thread refreshes up to the latest request and records it in
+# _completed, so any number of commits during one refresh are folded into the next. While refreshes succeed,
+# the view reflects a commit within one in-flight plus one new refresh.
+_changed = Condition()
+_requested = 0
+_completed = 0
+_worker: Optional[Thread] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _request_refresh_after_commit(session: Session) -> None:
+    if not session.info.get(PARTICIPANT_COUNTS_STALE, False):
+        return
+    bind = session.get_bind()
+    if isinstance(bind, Engine) and bind.dialect.name == "postgresql":
+        request_refresh(bind)
+
+
+def request_refresh(bind: Engine) -> None:
+    """Queue a refresh of the view and return immediately"""
+    global _requested, _worker
+    with _changed:
+        _requested += 1
+        if _worker is None:
+            _worker = Thread(target=_refresh_forever, args=(bind,), name="participant-counts-refresh", daemon=True)
+            _worker.start()
+        _changed.notify_all()
+
+
+def wait_for_refresh(timeout: Optional[float] = None) -> bool:
+    """Block until every refresh requested so far has completed; False if the timeout expired first"""
+    with _changed:
+        target = _requested
+        return _changed.wait_for(lambda: _completed >= target, timeout)
+
+
+def _refresh_forever(bind: Engine) -> None:
+    global _completed
+    delay = RETRY_INITIAL_SECONDS
+    while True:
+        with _changed:
+            _changed.wait_for(lambda: _requested > _completed)
+            target = _requested
+
+        try:
+            with bind.begin() as connection:
+                connection.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {PARTICIPANT_COUNTS_VIEW}"))
+        except SQLAlchemyError as error:
+            # Only the first failure in a row carries the traceback; repeats would just flood the log
+            if delay == RETRY_INITIAL_SECONDS:
+                logger.exception(f"Refreshing {PARTICIPANT_COUNTS_VIEW} failed, retrying in {delay:.0f}s")
+            else:
+                logger.warning(f"Refreshing {PARTICIPANT_COUNTS_VIEW} failed again ({error}), retrying in {delay:.0f}s")
+            sleep(delay)
+            delay = min(delay * 2, RETRY_MAX_SECONDS)
+            continue
+
+        delay = RETRY_INITIAL_SECONDS
+        with _changed:
+            _completed = target
+            _changed.notify_all()
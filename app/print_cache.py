@@ -0,0 +1,160 @@
+"""Process-local cache of the schedule details used for printing"""
+
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, count
+from typing import Optional, Set, Tuple
+
+from sqlalchemy import DateTime, event, func, or_, update
+from sqlalchemy.orm import SessionTransaction
+from sqlalchemy.orm.attributes import get_history
+from sqlmodel import Session, col, select
+
+from app.database import get_session
+from app.models import (
+    PARTICIPANT_COUNTS_STALE,
+    Event,
+    EventParticipant,
+    Schedule,
+    ScheduleSlot,
+    ScheduleSlotDetail,
+    Student,
+    strict_load,
+)
+
+PRINT_CACHE_STALE = "print_cache_stale"  # Session.info flag set when a flush changed printed data
+_PRINTED_MODELS = (Schedule, ScheduleSlot, Event, EventParticipant, Student)
+
+
+# Bumped by every invalidation. It is part of the cache key, so a fill that read its data before a commit
+# lands under the old generation and is never served once the commit has invalidated the cache.
+_generations = count()
+_generation = next(_generations)
+
+
+def get_slot_details(schedule_id: int) -> Tuple[ScheduleSlotDetail, ...]:
+    """Printable slots of a schedule in display order, cached until printed data changes"""
+    return _load_slot_details(schedule_id, _generation)
+
+
+@lru_cache(maxsize=256)
+def _load_slot_details(schedule_id: int, generation: int) -> Tuple[ScheduleSlotDetail, ...]:
+    with get_session() as session:
+        slots = session.exec(
+            select(ScheduleSlot)
+            .where(ScheduleSlot.schedule_id == schedule_id)
+            .order_by(col(ScheduleSlot.order_index))
+            .options(*strict_load(ScheduleSlot.event))
+        ).all()
+        participants = {
+            event_id: tuple(event_participants)
+            for event_id, event_participants in EventParticipant.participants_by_event(
+                session, list({slot.event_id for slot in slots})
+            ).items()
+        }
+
+        return tuple(
+            ScheduleSlotDetail(
+                id=slot.id,
+                event_name=slot.event.name,
+                event_category=slot.event.category,
+                start_time=slot.start_time,
+                end_time=slot.end_time,
+                venue=slot.venue,
+                notes=slot.notes,
+                participant_count=len(participants[slot.event_id]),
+                participants=participants[slot.event_id],
+            )
+            for slot in slots
+            if slot.id is not None  # always set on loaded rows; narrows the Optional primary key
+        )
+
+
+def invalidate_slot_details() -> None:
+    """Drop all cached slot details; fills already in flight are not served afterwards"""
+    global _generation
+    _generation = next(_generations)
+    _load_slot_details.cache_clear()
+
+
+def get_last_modified(schedule_id: int) -> Optional[datetime]:
+    """When the schedule last changed, for Last-Modified / If-Modified-Since checks
+
+    The latest updated_at of the schedule, its slots and its events' participants, computed at read time so
+    inserting or editing slots and participants never locks the schedule row. That covers Core updates with an
+    onupdate stamp too, such as the student renames copied into the participants. Removals, moves and event
+    edits leave no newer row behind, so _touch_schedules bumps the schedule for them when they are flushed
+    through the ORM; deletes and event updates that bypass the ORM are not seen. Comparing this against the
+    request header lets a print endpoint answer 304 before any ORM work.
+    """
+    with get_session() as session:
+        newest_slot = (
+            select(func.max(ScheduleSlot.updated_at)).where(ScheduleSlot.schedule_id == schedule_id).scalar_subquery()
+        )
+        newest_participant = (
+            select(func.max(EventParticipant.updated_at))
+            .join(ScheduleSlot, col(ScheduleSlot.event_id) == col(EventParticipant.event_id))
+            .where(ScheduleSlot.schedule_id == schedule_id)
+            .scalar_subquery()
+        )
+        # SQLite spells GREATEST as a multi-argument max()
+        greatest = func.greatest if session.get_bind().dialect.name == "postgresql" else func.max
+        updated_at = col(Schedule.updated_at)
+        last_modified = greatest(
+            updated_at,
+            func.coalesce(newest_slot, updated_at),
+            func.coalesce(newest_participant, updated_at),
+            type_=DateTime(timezone=True),
+        )
+        return session.exec(select(last_modified).where(Schedule.id == schedule_id)).first()
+
+
+# The cache is invalidated after commit rather than at flush time: until the commit, readers would only
+# re-cache the old data. Fills that began before the commit are discarded by the generation bump.
+@event.listens_for(Session, "after_flush")
+def _flag_printed_changes(session: Session, flush_context) -> None:
+    if any(isinstance(obj, _PRINTED_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info[PRINT_CACHE_STALE] = True
+
+
+# Slot and participant removals, moves between schedules or events, and event edits leave no newer row for
+# get_last_modified to read, so they bump the schedules they affect in the same transaction instead.
+@event.listens_for(Session, "after_flush")
+def _touch_schedules(session: Session, flush_context) -> None:
+    schedule_ids: Set[int] = set()
+    event_ids: Set[int] = set()
+    for obj in session.deleted:
+        if isinstance(obj, ScheduleSlot):
+            schedule_ids.add(obj.schedule_id)
+        elif isinstance(obj, EventParticipant):
+            event_ids.add(obj.event_id)
+    for obj in session.dirty:
+        if isinstance(obj, ScheduleSlot):
+            schedule_ids.update(get_history(obj, "schedule_id").deleted)
+        elif isinstance(obj, EventParticipant):
+            event_ids.update(get_history(obj, "event_id").deleted)
+        elif isinstance(obj, Event) and obj.id is not None:
+            if any(get_history(obj, key).has_changes() for key in ("name", "category")):
+                event_ids.add(obj.id)
+    if not schedule_ids and not event_ids:
+        return
+
+    slots_of_events = select(ScheduleSlot.schedule_id).where(col(ScheduleSlot.event_id).in_(event_ids))
+    session.connection().execute(
+        update(Schedule)
+        .where(or_(col(Schedule.id).in_(schedule_ids), col(Schedule.id).in_(slots_of_events)))
+        .values(updated_at=func.now())
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_slot_details(session: Session) -> None:
+    # PARTICIPANT_COUNTS_STALE also covers participant changes made outside the flush, e.g. bulk_assign
+    if session.info.get(PRINT_CACHE_STALE, False) or session.info.get(PARTICIPANT_COUNTS_STALE, False):
+        invalidate_slot_details()
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_printed_changes(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(PRINT_CACHE_STALE, None)
@@ -1,4 +1,5 @@
 from app.database import create_tables
+import app.participant_counts  # noqa: F401  registers the view refresh after participant commits
 from nicegui import ui
 
 
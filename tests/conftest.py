@@ -1,5 +1,9 @@
-from typing import Generator
+from datetime import datetime, time
+from itertools import count
+from typing import Callable, Generator, List, NamedTuple
 import pytest
+from app.database import get_session, reset_db
+from app.models import Admin, Event, EventParticipant, Schedule, ScheduleSlot, Student
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +14,78 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture()
+def clean_db() -> Generator[None, None, None]:
+    """Reset database for each test"""
+    reset_db()
+    yield
+    reset_db()
+
+
+class ScheduleGraph(NamedTuple):
+    """Ids of the rows created by the create_schedule fixture, in index order"""
+
+    schedule_id: int
+    admin_id: int
+    student_ids: List[int]
+    event_ids: List[int]
+
+
+@pytest.fixture()
+def create_schedule(clean_db) -> Callable[..., ScheduleGraph]:
+    """Factory for a schedule with one student, event and slot per index
+
+    Student i ("Student i", class 5A) takes part in event i ("Event i") unless assign=False; slot i runs from
+    9+i to 10+i o'clock.
+    """
+    admins = count()
+
+    def create(slot_count: int, assign: bool = True) -> ScheduleGraph:
+        with get_session() as session:
+            admin_index = next(admins)
+            admin = Admin(
+                username=f"admin{admin_index}",
+                password_hash="x" * 60,
+                name="Admin",
+                email=f"admin{admin_index}@example.com",
+            )
+            session.add(admin)
+            session.flush()
+            assert admin.id is not None
+
+            schedule = Schedule(
+                name="Main Event Schedule", event_date=datetime(2026, 1, 15), created_by_admin_id=admin.id
+            )
+            session.add(schedule)
+            session.flush()
+            assert schedule.id is not None
+
+            student_ids: List[int] = []
+            event_ids: List[int] = []
+            for index in range(slot_count):
+                student = Student(name=f"Student {index}", class_name="5A")
+                event_ = Event(name=f"Event {index}", category="Song Arabic")
+                session.add_all([student, event_])
+                session.flush()
+                assert student.id is not None and event_.id is not None
+                student_ids.append(student.id)
+                event_ids.append(event_.id)
+                if assign:
+                    session.add(
+                        EventParticipant(student_id=student.id, event_id=event_.id, assigned_by_admin_id=admin.id)
+                    )
+                session.add(
+                    ScheduleSlot(
+                        schedule_id=schedule.id,
+                        event_id=event_.id,
+                        start_time=time(9 + index),
+                        end_time=time(10 + index),
+                        order_index=index,
+                    )
+                )
+            session.commit()
+            return ScheduleGraph(schedule.id, admin.id, student_ids, event_ids)
+
+    return create
@@ -0,0 +1,310 @@
+"""Database-level tests for model loading and persistence behaviour."""
+
+from contextlib import contextmanager
+from datetime import time
+from typing import Generator, List
+
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlmodel import col, select
+
+from app.database import ENGINE, get_session
+from app.models import (
+    EVENT_ACTIVE_STMT,
+    SCHEDULE_BY_ID_STMT,
+    STUDENT_ACTIVE_STMT,
+    Admin,
+    Event,
+    EventParticipant,
+    Participant,
+    Schedule,
+    SchedulerEvent,
+    ScheduleSlot,
+    Student,
+    StudentCategory,
+    StudentWithEvents,
+    iter_schedule_slots,
+    minute_of_day,
+    strict_load,
+)
+from app.participant_counts import wait_for_refresh
+from app.print_cache import get_slot_details, invalidate_slot_details
+
+
+@contextmanager
+def recorded_statements() -> Generator[List[str], None, None]:
+    """Collect the SQL statements sent to the database inside the block"""
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(ENGINE, "before_cursor_execute", record)
+
+
+def count_schedule_render_queries(schedule_id: int) -> int:
+    invalidate_slot_details()
+    with recorded_statements() as statements:
+        details = get_slot_details(schedule_id)
+    assert details and all(detail.event_name and detail.participants for detail in details)
+    assert not any("FROM students" in statement for statement in statements)
+    return len(statements)
+
+
+@pytest.mark.sqlmodel
+def test_schedule_rendering_query_count_is_independent_of_slot_count(create_schedule):
+    small = create_schedule(slot_count=1).schedule_id
+    large = create_schedule(slot_count=5).schedule_id
+
+    assert count_schedule_render_queries(small) == count_schedule_render_queries(large)
+
+
+@pytest.mark.sqlmodel
+def test_strict_load_raises_on_unrequested_relationships(create_schedule):
+    schedule_id = create_schedule(slot_count=2).schedule_id
+
+    with get_session() as session:
+        schedule = session.exec(
+            select(Schedule).where(Schedule.id == schedule_id).options(*strict_load(Schedule.schedule_slots))
+        ).one()
+
+        assert [slot.order_index for slot in schedule.schedule_slots] == [0, 1]
+        with pytest.raises(InvalidRequestError):
+            _ = schedule.created_by_admin
+        with pytest.raises(InvalidRequestError):
+            _ = schedule.schedule_slots[0].event
+
+
+@pytest.mark.sqlmodel
+def test_load_all_students_with_events(create_schedule):
+    create_schedule(slot_count=2)
+    with get_session() as session:
+        session.add(Student(name="Unassigned", class_name="6B"))
+        session.commit()
+
+        students = {student.name: student.events for student in StudentWithEvents.load_all(session)}
+
+    assert students == {"Student 0": ["Event 0"], "Student 1": ["Event 1"], "Unassigned": []}
+
+
+@pytest.mark.sqlmodel
+def test_load_all_keeps_event_names_intact(create_schedule):
+    create_schedule(slot_count=1)
+    with get_session() as session:
+        event_ = session.exec(select(Event)).one()
+        event_.name = 'Quiz, "Round\x1f2"'
+        session.commit()
+
+        students = StudentWithEvents.load_all(session)
+
+    assert [student.events for student in students] == [['Quiz, "Round\x1f2"']]
+
+
+@pytest.mark.sqlmodel
+def test_participants_track_student_changes(create_schedule):
+    create_schedule(slot_count=1)
+    with get_session() as session:
+        student = session.exec(select(Student)).one()
+        student.class_name = "7C"
+        student.category = StudentCategory.SENIOR
+        session.commit()
+
+        participants = EventParticipant.participants_by_event(session, [student.event_participations[0].event_id])
+
+    assert list(participants.values()) == [[Participant("Student 0", "7C", StudentCategory.SENIOR)]]
+
+
+@pytest.mark.sqlmodel
+def test_categories_load_as_enum_members(create_schedule):
+    create_schedule(slot_count=1)
+    with get_session() as session:
+        session.exec(select(Student)).one().category = StudentCategory.SUPER_SENIOR
+        session.commit()
+        session.expunge_all()
+
+        student = session.exec(select(Student)).one()
+        participant = session.exec(select(EventParticipant)).one()
+        category = session.exec(select(Student.category)).one()
+
+    assert student.category is participant.student_category is category is StudentCategory.SUPER_SENIOR
+    assert student.category.name == "SUPER_SENIOR"
+
+
+@pytest.mark.sqlmodel
+def test_bulk_assign_skips_existing_assignments(create_schedule):
+    create_schedule(slot_count=2)
+    with get_session() as session:
+        admin = session.exec(select(Admin)).one()
+        students = session.exec(select(Student).order_by(Student.name)).all()
+        events = session.exec(select(Event).order_by(Event.name)).all()
+        assert admin.id is not None
+        pairs = [(student.id, event_.id) for student in students for event_ in events if student.id and event_.id]
+
+        created = EventParticipant.bulk_assign(session, pairs, admin.id)
+        session.commit()
+
+        assert created == 2  # each student already had one of the two events
+        assert len(session.exec(select(EventParticipant)).all()) == 4
+        assert EventParticipant.bulk_assign(session, pairs, admin.id) == 0
+
+
+@pytest.mark.sqlmodel
+def test_reverse_relationships_load_on_access(create_schedule):
+    create_schedule(slot_count=3)
+    with get_session() as session:
+        for model in (Student, Event, ScheduleSlot, Schedule):
+            rows = session.exec(select(model)).all()
+            assert rows
+            assert all(isinstance(obj, model) for obj in session.identity_map.values())
+            assert len(session.identity_map) == len(rows)
+            session.expunge_all()
+
+
+@pytest.mark.sqlmodel
+def test_new_participants_read_their_students_in_one_query(create_schedule):
+    create_schedule(slot_count=1)
+    with get_session() as session:
+        admin = session.exec(select(Admin)).one()
+        event_ = session.exec(select(Event)).one()
+        students = [Student(name=f"Pupil {index:02}", class_name="8D") for index in range(50)]
+        session.add_all(students)
+        session.commit()
+        assert admin.id is not None and event_.id is not None
+        student_ids = [student.id for student in students if student.id is not None]
+        admin_id, event_id = admin.id, event_.id
+        session.expunge_all()
+
+        with recorded_statements() as statements:
+            session.add_all(
+                EventParticipant(student_id=student_id, event_id=event_id, assigned_by_admin_id=admin_id)
+                for student_id in student_ids
+            )
+            session.commit()
+
+        participants = EventParticipant.participants_by_event(session, [event_id])
+
+    assert len([statement for statement in statements if "FROM students" in statement]) == 1
+    pupils = [participant for participant in participants[event_id] if participant.class_name == "8D"]
+    assert [participant.name for participant in pupils] == [f"Pupil {index:02}" for index in range(50)]
+
+
+@pytest.mark.sqlmodel
+def test_slot_minutes_follow_start_and_end_times(create_schedule):
+    schedule_id = create_schedule(slot_count=2).schedule_id
+    with get_session() as session:
+        first, second = session.exec(select(ScheduleSlot).order_by(col(ScheduleSlot.order_index))).all()
+        assert [tuple(row) for row in ScheduleSlot.interval_rows(session, schedule_id)] == [
+            (first.event_id, 540, 600),
+            (second.event_id, 600, 660),
+        ]
+
+        first.start_time = time(11, 15)
+        first.end_time = time(11, 45)
+        session.commit()
+
+        assert (first.start_min, first.end_min) == (675, 705)
+        assert [tuple(row) for row in ScheduleSlot.interval_rows(session, schedule_id)] == [
+            (second.event_id, 600, 660),
+            (first.event_id, 675, 705),
+        ]
+
+
+@pytest.mark.sqlmodel
+def test_core_slot_inserts_must_set_the_minutes(create_schedule):
+    graph = create_schedule(slot_count=1)
+    values = {"schedule_id": graph.schedule_id, "event_id": graph.event_ids[0], "start_time": time(14), "notes": ""}
+    with get_session() as session:
+        with pytest.raises(IntegrityError):
+            session.exec(insert(ScheduleSlot).values(**values, end_time=time(15)))  # type: ignore[call-overload]
+        session.rollback()
+
+        session.exec(
+            insert(ScheduleSlot).values(  # type: ignore[call-overload]
+                **values, end_time=time(14, 30), start_min=minute_of_day(time(14)), end_min=minute_of_day(time(14, 30))
+            )
+        )
+        session.commit()
+
+        assert (graph.event_ids[0], 840, 870) in [
+            tuple(row) for row in ScheduleSlot.interval_rows(session, graph.schedule_id)
+        ]
+
+
+@pytest.mark.sqlmodel
+def test_scheduler_rows_list_active_events_by_priority(create_schedule):
+    create_schedule(slot_count=1)  # "Event 0" with one participant
+    with get_session() as session:
+        session.add_all(
+            [
+                Event(name="Quiz", category="Quiz", priority=5, max_participants=3),
+                Event(name="Essay", category="Writing", priority=8, average_time_minutes=45),
+                Event(name="Retired", category="Quiz", priority=10, is_active=False),
+            ]
+        )
+        session.commit()
+        ids = {event_.name: event_.id for event_ in session.exec(select(Event)).all() if event_.id is not None}
+
+        assert wait_for_refresh(timeout=10)  # counts come from the materialized view on PostgreSQL
+        rows = Event.scheduler_rows(session)
+
+    assert rows == [
+        SchedulerEvent(ids["Essay"], 8, 45, None, 0),
+        SchedulerEvent(ids["Quiz"], 5, 30, 3, 0),
+        SchedulerEvent(ids["Event 0"], 1, 30, None, 1),
+    ]
+
+
+@pytest.mark.sqlmodel
+def test_hot_statements_load_only_their_own_rows(create_schedule):
+    schedule_id = create_schedule(slot_count=3).schedule_id
+    with get_session() as session:
+        with recorded_statements() as statements:
+            events = session.scalars(EVENT_ACTIVE_STMT).all()
+        assert len(statements) == 1
+        assert len(session.identity_map) == len(events) == 3
+        with pytest.raises(InvalidRequestError):
+            _ = events[0].event_participations
+        session.expunge_all()
+
+        with recorded_statements() as statements:
+            student = session.scalars(STUDENT_ACTIVE_STMT).first()
+        assert student is not None and student.name == "Student 0"
+        assert len(statements) == 1
+        assert all(isinstance(obj, Student) for obj in session.identity_map.values())
+        session.expunge_all()
+
+        with recorded_statements() as statements:
+            schedule = session.scalars(SCHEDULE_BY_ID_STMT, {"sid": schedule_id}).first()
+        assert schedule is not None and schedule.id == schedule_id
+        assert len(statements) == 1
+        assert list(session.identity_map.values()) == [schedule]
+
+
+@pytest.mark.sqlmodel
+def test_iter_schedule_slots_streams_in_batches(create_schedule):
+    schedule_id = create_schedule(slot_count=1).schedule_id
+    with get_session() as session:
+        event_id = session.exec(select(Event.id)).one()
+        assert event_id is not None
+        session.add_all(
+            ScheduleSlot(
+                schedule_id=schedule_id, event_id=event_id, start_time=time(12), end_time=time(13), order_index=index
+            )
+            for index in range(450, 0, -1)
+        )
+        session.commit()
+
+    with get_session() as session, recorded_statements() as statements:
+        slots = list(iter_schedule_slots(session, schedule_id))
+
+        assert [slot.order_index for slot in slots] == list(range(451))
+        assert all(slot.event.name == "Event 0" for slot in slots)
+        with pytest.raises(InvalidRequestError):
+            _ = slots[0].schedule
+
+    assert len(statements) == 1 + 3  # the slot query plus one event query per batch of 200
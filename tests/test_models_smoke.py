@@ -1,11 +1,15 @@
 """Smoke test for SQLModel database setup."""
 
+from threading import get_ident
+from typing import List
+
 import pytest
-from sqlmodel import SQLModel, text
+from sqlalchemy import event
+from sqlmodel import SQLModel, select, text
 import os
 
-from app.database import create_tables, ENGINE
-from app import models
+from app.database import create_tables, get_session, ENGINE
+from app import models, participant_counts, print_cache
 
 
 @pytest.mark.sqlmodel
@@ -28,6 +32,100 @@ def test_sqlmodel_smoke():
         assert table_name in db_tables, f"Table '{table_name}' not found in database"
 
 
+@pytest.mark.sqlmodel
+@pytest.mark.skipif(ENGINE.dialect.name != "postgresql", reason="Materialized views are PostgreSQL only")
+def test_participant_counts_view_refreshes_after_commit(create_schedule):
+    """The materialized participant counts exist, can be refreshed concurrently and follow committed changes."""
+
+    with ENGINE.connect() as conn:
+        views = {row[0] for row in conn.execute(text("SELECT matviewname FROM pg_matviews"))}
+        indexes = {
+            row[0]
+            for row in conn.execute(
+                text("SELECT indexname FROM pg_indexes WHERE tablename = :view"),
+                {"view": models.PARTICIPANT_COUNTS_VIEW},
+            )
+        }
+    assert models.PARTICIPANT_COUNTS_VIEW in views
+    assert f"ux_{models.PARTICIPANT_COUNTS_VIEW}_event" in indexes
+
+    graph = create_schedule(slot_count=2, assign=False)
+    event_id = graph.event_ids[0]
+    with get_session() as session:
+        models.EventParticipant.bulk_assign(
+            session, [(student_id, event_id) for student_id in graph.student_ids], graph.admin_id
+        )
+        session.commit()
+
+        assert participant_counts.wait_for_refresh(timeout=10)
+        counts = models.EventParticipantCount.by_event(session)
+
+    assert counts[event_id].participant_count == 2
+
+
+@pytest.mark.sqlmodel
+@pytest.mark.skipif(ENGINE.dialect.name != "postgresql", reason="Materialized views are PostgreSQL only")
+def test_participant_counts_refresh_runs_off_the_committing_thread(create_schedule):
+    """Committing only queues the refresh; the background worker runs it."""
+
+    graph = create_schedule(slot_count=1, assign=False)
+    refresh_threads: List[int] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("REFRESH MATERIALIZED VIEW"):
+            refresh_threads.append(get_ident())
+
+    event.listen(ENGINE, "before_cursor_execute", record)
+    try:
+        with get_session() as session:
+            session.add(
+                models.EventParticipant(
+                    student_id=graph.student_ids[0], event_id=graph.event_ids[0], assigned_by_admin_id=graph.admin_id
+                )
+            )
+            session.commit()
+
+            assert participant_counts.wait_for_refresh(timeout=10)
+            counts = models.EventParticipantCount.by_event(session)
+    finally:
+        event.remove(ENGINE, "before_cursor_execute", record)
+
+    assert refresh_threads and get_ident() not in refresh_threads
+    assert counts[graph.event_ids[0]].participant_count == 1
+
+
+@pytest.mark.sqlmodel
+@pytest.mark.skipif(ENGINE.dialect.name != "postgresql", reason="The updated_at trigger is PostgreSQL only")
+def test_schedule_last_modified_follows_schedule_and_participant_writes(create_schedule):
+    """Only schedules carries a trigger; participant writes move the last-modified time without touching it."""
+
+    with ENGINE.connect() as conn:
+        triggers = {
+            (row[0], row[1])
+            for row in conn.execute(text("SELECT event_object_table, trigger_name FROM information_schema.triggers"))
+        }
+    assert triggers == {("schedules", "trg_schedules_updated_at")}
+
+    graph = create_schedule(slot_count=2, assign=False)
+    schedule_id, event_id = graph.schedule_id, graph.event_ids[0]
+    created = print_cache.get_last_modified(schedule_id)
+
+    with ENGINE.begin() as conn:  # bypasses the ORM's onupdate
+        conn.execute(text("UPDATE schedules SET name = 'Day 2' WHERE id = :id"), {"id": schedule_id})
+    renamed = print_cache.get_last_modified(schedule_id)
+
+    with get_session() as session:
+        models.EventParticipant.bulk_assign(
+            session, [(student_id, event_id) for student_id in graph.student_ids], graph.admin_id
+        )
+        session.commit()
+        updated_at = session.exec(select(models.Schedule.updated_at).where(models.Schedule.id == schedule_id)).one()
+    assigned = print_cache.get_last_modified(schedule_id)
+
+    assert created is not None and renamed is not None and updated_at is not None and assigned is not None
+    assert created < renamed == updated_at < assigned
+
+
 DATABRICKS_HOST = os.environ.get("DATABRICKS_HOST")
 DATABRICKS_TOKEN = os.environ.get("DATABRICKS_TOKEN")
 
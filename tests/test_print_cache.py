@@ -0,0 +1,114 @@
+"""Tests for the cached schedule print details."""
+
+from contextlib import contextmanager
+from datetime import time
+from typing import Generator
+
+import pytest
+from sqlmodel import Session, col, select, text
+
+from app.database import ENGINE, get_session
+from app.models import Admin, EventParticipant, Participant, ScheduleSlot, Student, StudentCategory
+from app import print_cache
+from app.print_cache import get_slot_details, invalidate_slot_details
+
+
+@pytest.fixture()
+def schedule_id(create_schedule) -> Generator[int, None, None]:
+    invalidate_slot_details()
+    yield create_schedule(slot_count=1).schedule_id
+    invalidate_slot_details()
+
+
+@pytest.mark.sqlmodel
+def test_slot_details_include_participants(schedule_id):
+    details = get_slot_details(schedule_id)
+
+    assert len(details) == 1
+    assert details[0].event_name == "Event 0"
+    assert details[0].start_time == time(9)
+    assert details[0].participant_count == 1
+    assert details[0].participants == (Participant("Student 0", "5A", StudentCategory.SUB_JUNIOR),)
+    assert get_slot_details(schedule_id) is details
+
+
+@pytest.mark.sqlmodel
+def test_slot_details_refresh_after_commit(schedule_id):
+    cached = get_slot_details(schedule_id)
+
+    with get_session() as session:
+        slot = session.exec(select(ScheduleSlot).where(ScheduleSlot.schedule_id == schedule_id)).one()
+        slot.venue = "Auditorium"
+        session.commit()
+
+    details = get_slot_details(schedule_id)
+    assert details is not cached
+    assert details[0].venue == "Auditorium"
+
+
+@pytest.mark.sqlmodel
+def test_fill_started_before_commit_is_not_served(schedule_id):
+    generation = print_cache._generation
+
+    with get_session() as session:
+        slot = session.exec(select(ScheduleSlot).where(ScheduleSlot.schedule_id == schedule_id)).one()
+        slot.venue = "Auditorium"
+        session.commit()
+
+    # A reader that read its data before the commit stores its result only after the cache was invalidated
+    stale = print_cache._load_slot_details(schedule_id, generation)
+
+    details = get_slot_details(schedule_id)
+    assert details is not stale
+    assert details[0].venue == "Auditorium"
+
+
+@pytest.mark.sqlmodel
+def test_discarded_flush_does_not_invalidate_a_later_commit(schedule_id):
+    cached = get_slot_details(schedule_id)
+
+    with get_session() as session:
+        slot = session.exec(select(ScheduleSlot).where(ScheduleSlot.schedule_id == schedule_id)).one()
+        slot.venue = "Auditorium"
+        session.flush()
+        session.close()  # neither committed nor explicitly rolled back
+
+        session.add(Admin(username="editor", password_hash="x" * 60, name="Editor", email="editor@example.com"))
+        session.commit()
+
+    assert get_slot_details(schedule_id) is cached
+
+
+@contextmanager
+def moves_last_modified(schedule_id: int) -> Generator[Session, None, None]:
+    """Session whose committed changes must move the schedule's last-modified time forward"""
+    with ENGINE.begin() as conn:  # backdated, as SQLite timestamps only have second resolution
+        for table in ("schedules", "schedule_slots", "event_participants"):
+            conn.execute(text(f"UPDATE {table} SET updated_at = '2020-01-01 00:00:00'"))
+    before = print_cache.get_last_modified(schedule_id)
+
+    with get_session() as session:
+        yield session
+        session.commit()
+
+    after = print_cache.get_last_modified(schedule_id)
+    assert before is not None and after is not None and after > before
+
+
+@pytest.mark.sqlmodel
+def test_last_modified_follows_edits_and_removals(create_schedule):
+    schedule_id = create_schedule(slot_count=2).schedule_id
+    first_slot = select(ScheduleSlot).where(ScheduleSlot.order_index == 0)
+
+    with moves_last_modified(schedule_id) as session:
+        session.exec(first_slot).one().venue = "Auditorium"
+    with moves_last_modified(schedule_id) as session:
+        session.exec(first_slot).one().event.name = "Renamed"
+    with moves_last_modified(schedule_id) as session:
+        session.exec(first_slot).one().event.category = "Quiz"
+    with moves_last_modified(schedule_id) as session:
+        session.exec(select(Student).where(Student.name == "Student 0")).one().name = "Renamed"
+    with moves_last_modified(schedule_id) as session:
+        session.delete(session.exec(select(EventParticipant).order_by(col(EventParticipant.id))).first())
+    with moves_last_modified(schedule_id) as session:
+        session.delete(session.exec(select(ScheduleSlot).where(ScheduleSlot.order_index == 1)).one())